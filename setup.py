@@ -33,6 +33,8 @@ setup(
     url='https://github.com/Qazalbash/wordle-pycli',
     packages=find_packages(),
     include_package_data=True,
+    package_data={'wordle_pycli': ['words.txt']},
+    extras_require={'fast': ['numba', 'numpy']},
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
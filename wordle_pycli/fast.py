@@ -0,0 +1,130 @@
+# MIT License
+
+# Copyright (c) 2023 Meesum Qazalbash
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compiled scoring kernels for solvers and batch analysis.
+
+Install with ``pip install wordle-pycli[fast]``. Without numba the kernels still run as plain numpy/Python code.
+"""
+
+import numpy as np
+
+from .allowed_words import _WORDS_BLOB, WORD_LENGTH
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+GREY_CODE = 0
+YELLOW_CODE = 1
+GREEN_CODE = 2
+
+# every word of the word list as a row of 5 ascii codes
+WORDS_U8 = np.frombuffer(_WORDS_BLOB, dtype=np.uint8).reshape(-1, WORD_LENGTH)
+
+
+def encode(word: str) -> np.ndarray:
+    """Encodes a word as an array of ascii codes.
+
+    Parameters
+    ----------
+    word : str
+        The word to encode.
+
+    Returns
+    -------
+    np.ndarray
+        The word as a uint8 array.
+    """
+    return np.frombuffer(word.encode(), dtype=np.uint8)
+
+
+@njit(cache=True)
+def score_into(guess: np.ndarray, target: np.ndarray, out: np.ndarray, remaining: np.ndarray) -> None:
+    """Scores the guess against the target using a caller supplied scratch buffer.
+
+    Parameters
+    ----------
+    guess : np.ndarray
+        The guess word as a uint8 array.
+    target : np.ndarray
+        The target word as a uint8 array.
+    out : np.ndarray
+        uint8 array receiving GREY_CODE, YELLOW_CODE or GREEN_CODE for each letter of the guess.
+    remaining : np.ndarray
+        uint8 scratch array of 26 letter counts, zeroed on return.
+    """
+    for i in range(guess.shape[0]):
+        if guess[i] == target[i]:
+            out[i] = GREEN_CODE
+        else:
+            out[i] = GREY_CODE
+            remaining[target[i] - 97] += 1
+
+    for i in range(guess.shape[0]):
+        letter = guess[i] - 97
+        if out[i] != GREEN_CODE and remaining[letter] > 0:
+            out[i] = YELLOW_CODE
+            remaining[letter] -= 1
+
+    # leave the scratch buffer clean for the next call
+    for i in range(target.shape[0]):
+        remaining[target[i] - 97] = 0
+
+
+@njit(cache=True)
+def score(guess: np.ndarray, target: np.ndarray, out: np.ndarray) -> None:
+    """Scores the guess against the target, writing a colour code per letter into out.
+
+    Parameters
+    ----------
+    guess : np.ndarray
+        The guess word as a uint8 array.
+    target : np.ndarray
+        The target word as a uint8 array.
+    out : np.ndarray
+        uint8 array receiving GREY_CODE, YELLOW_CODE or GREEN_CODE for each letter of the guess.
+    """
+    score_into(guess, target, out, np.zeros(26, dtype=np.uint8))
+
+
+@njit(cache=True)
+def score_many(guess: np.ndarray, targets: np.ndarray, out: np.ndarray) -> None:
+    """Scores the guess against every row of targets.
+
+    Parameters
+    ----------
+    guess : np.ndarray
+        The guess word as a uint8 array.
+    targets : np.ndarray
+        Target words as a 2D uint8 array, e.g. `WORDS_U8`.
+    out : np.ndarray
+        2D uint8 array of the same shape as targets receiving the colour codes.
+    """
+    remaining = np.zeros(26, dtype=np.uint8)
+    for j in range(targets.shape[0]):
+        score_into(guess, targets[j], out[j], remaining)
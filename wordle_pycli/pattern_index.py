@@ -0,0 +1,97 @@
+# MIT License
+
+# Copyright (c) 2023 Meesum Qazalbash
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from typing import Iterable, Optional
+
+from . import allowed_words
+
+
+class PatternIndex:
+    """Index of a word list by letter and by (position, letter) for constrained lookups.
+
+    Filtering intersects a few precomputed sets of word indices instead of scanning the whole word list, which is what
+    a solver or a hard mode needs to narrow down the candidates after each guess.
+
+    Parameters
+    ----------
+    words : Iterable[str], optional
+        Words to index, by default the full word list
+    """
+
+    def __init__(self, words: Optional[Iterable[str]] = None) -> None:
+        self.words = list(words) if words is not None else allowed_words.WORDS
+        self._by_position = {}
+        self._by_letter = {}
+
+        for i, word in enumerate(self.words):
+            for position, letter in enumerate(word):
+                self._by_position.setdefault((position, letter), set()).add(i)
+                self._by_letter.setdefault(letter, set()).add(i)
+
+    def filter(self,
+               greens: Optional[dict] = None,
+               yellows: Optional[Iterable[tuple]] = None,
+               greys: Optional[Iterable[tuple]] = None) -> list:
+        """Returns the words consistent with the given clues.
+
+        Parameters
+        ----------
+        greens : dict, optional
+            Maps a position to the letter known to be there, by default None
+        yellows : Iterable[tuple], optional
+            (position, letter) pairs of letters in the word but not at that position, by default None
+        greys : Iterable[tuple], optional
+            (position, letter) pairs of letters marked grey at that position, by default None. A grey letter that is
+            also green or yellow is a duplicate, it only rules out that position rather than the whole word.
+
+        Returns
+        -------
+        list
+            Matching words in word list order.
+        """
+        greens = greens or {}
+        yellows = list(yellows or ())
+        greys = list(greys or ())
+        empty = set()
+
+        # start from the smallest positive constraint so the intersections never touch the whole word list
+        required = [self._by_position.get((position, letter), empty) for position, letter in greens.items()]
+        required += [self._by_letter.get(letter, empty) for _, letter in yellows]
+        if required:
+            required.sort(key=len)
+            candidates = set(required[0])
+            for indices in required[1:]:
+                candidates &= indices
+        else:
+            candidates = set(range(len(self.words)))
+
+        for position, letter in yellows:
+            candidates -= self._by_position.get((position, letter), empty)
+
+        known_letters = set(greens.values()) | {letter for _, letter in yellows}
+        for position, letter in greys:
+            if letter in known_letters:
+                candidates -= self._by_position.get((position, letter), empty)
+            else:
+                candidates -= self._by_letter.get(letter, empty)
+
+        return [self.words[i] for i in sorted(candidates)]
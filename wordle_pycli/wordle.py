@@ -20,231 +20,407 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import contextlib
 import json
 import os
-import random
+import sys
 import time
 
-try:
-    from .allowed_words import WORDS
-except ImportError:
-    from allowed_words import WORDS
+from .allowed_words import contains, random_word
 
+ALPHABET = "abcdefghijklmnopqrstuvwxyz"
 
-def print_centered(text: str, width: int = 80) -> None:
-    """Prints the given text centered within the given width.
+# coloured glyphs for each letter, indexed by ord(letter) - 97
+GREEN = tuple("\033[42m" + c + "\033[0m" for c in ALPHABET)
+YELLOW = tuple("\033[43m" + c + "\033[0m" for c in ALPHABET)
+GREY = tuple("\033[40m" + c + "\033[0m" for c in ALPHABET)
+DIM = tuple("\033[100m" + c + "\033[0m" for c in ALPHABET)
 
-    Parameters
-    ----------
-    text : str
-        The text to be printed.
-    width : int, optional
-        Width of the text, by default 80
-    """
-    print(text.center(width))
+# keyboard state codes, a higher code always wins over a lower one
+UNSEEN, ABSENT, PRESENT, CORRECT = range(4)
+
+# keyboard glyphs indexed by state code, then by ord(letter) - 97
+_KEY_GLYPHS = (tuple(ALPHABET), DIM, YELLOW, GREEN)
+
+# lowest bit of each of the five 5 bit lanes of a packed word
+_LANE_LSB = 0b00001_00001_00001_00001_00001
+
+CLEAR_SCREEN = "\033[2J\033[H"
 
+# borders of the default 80 column frame
+_HBORDER_75 = "─" * 75
+_TOP_BAR_80 = "┌" + _HBORDER_75 + "┐"
+_BOT_BAR_80 = "└" + _HBORDER_75 + "┘"
+_BOARD_TOP_80 = "\033[100m┌\033[0m" + "\033[100m─\033[0m" * 75 + "\033[100m┐\033[0m"
+_BOARD_BOT_80 = "\033[100m└\033[0m" + "\033[100m─\033[0m" * 75 + "\033[100m┘\033[0m"
+_GITHUB_LINE_80 = "│" + "https://github.com/Qazalbash/wordle-pycli".center(75) + "│"
+_SCORE_TITLE_80 = "│" + "Score".center(75) + "│"
 
-def display_title_bar(title: str, width: int = 80) -> None:
+KEYBOARD_ROWS = (' q w e r t y u i o p ', '  a s d f g h j k l  ', '   z x c v b n m   ')
+_KEYBOARD_WIDTH = max(len(row) for row in KEYBOARD_ROWS)
+_KEYBOARD_TOP = "┌" + "─" * _KEYBOARD_WIDTH + "┐"
+_KEYBOARD_BOT = "└" + "─" * _KEYBOARD_WIDTH + "┘"
+_PAD_KEYBD_L = " " * ((80 - _KEYBOARD_WIDTH) // 2)
+_PAD_KEYBD_R = " " * (80 - _KEYBOARD_WIDTH - len(_PAD_KEYBD_L))
+
+
+def display_title_bar(buf: list, title: str, width: int = 80) -> None:
     """Displays a title bar with the given title centered within it.
 
     Parameters
     ----------
+    buf : list
+        Frame buffer the lines are appended to.
     title : str
         The title to be displayed in the title bar.
     width : int, optional
         Width of the title bar, by default 80
     """
 
-    horizontal_border = "─"
     vertical_border = "│"
-    corner_top_left = "┌"
-    corner_top_right = "┐"
-    corner_bottom_left = "└"
-    corner_bottom_right = "┘"
     reset_style = "\033[0m"
 
     title_text = f"{title}".center(width + 89)
-    github_link = "https://github.com/Qazalbash/wordle-pycli".center(width - 5)
 
-    inner_width = width - 5
+    if width == 80:
+        top_bar, bottom_bar, github_line = _TOP_BAR_80, _BOT_BAR_80, _GITHUB_LINE_80
+    else:
+        horizontal_border = "─" * (width - 5)
+        top_bar, bottom_bar = "┌" + horizontal_border + "┐", "└" + horizontal_border + "┘"
+        github_line = vertical_border + "https://github.com/Qazalbash/wordle-pycli".center(width - 5) + vertical_border
 
-    print(corner_top_left + (horizontal_border * inner_width) + corner_top_right)
-    print(vertical_border + title_text + vertical_border)
-    print(vertical_border + github_link + vertical_border)
-    print(corner_bottom_left + (horizontal_border * inner_width) + corner_bottom_right + reset_style)
+    buf.append(top_bar)
+    buf.append(vertical_border + title_text + vertical_border)
+    buf.append(github_line)
+    buf.append(bottom_bar + reset_style)
 
 
-def display_game_board(guesses: str, width: int = 80) -> None:
-    """Displays the game board with the given guesses.
+def render_board_row(guess: str, width: int = 80) -> str:
+    """Renders a scored guess as a game board row.
 
     Parameters
     ----------
-    guesses : str
-        The guesses to be displayed on the game board.
+    guess : str
+        The scored guess to be displayed on the game board.
     width : int, optional
         Width of the game board, by default 80
-    """
 
-    horizontal_border = "\033[100m─\033[0m"
+    Returns
+    -------
+    str
+        The board row, ready to be displayed.
+    """
     vertical_border = "\033[100m│\033[0m"
-    corner_top_left = "\033[100m┌\033[0m"
-    corner_top_right = "\033[100m┐\033[0m"
-    corner_bottom_left = "\033[100m└\033[0m"
-    corner_bottom_right = "\033[100m┘\033[0m"
-
-    inner_width = width - 5
-    padding = 35
-
-    print_centered(corner_top_left + (horizontal_border * inner_width) + corner_top_right, width)
-
-    for guess in guesses:
-        guess_line = vertical_border + ' ' * padding + guess + ' ' * padding + vertical_border
-        print_centered(guess_line, width)
+    padding = ' ' * 35
 
-    print_centered(corner_bottom_left + (horizontal_border * inner_width) + corner_bottom_right, width)
+    # the escape sequences already make the row longer than the default width, so centering it is a no-op
+    guess_line = vertical_border + padding + guess + padding + vertical_border
+    return guess_line if width == 80 else guess_line.center(width)
 
 
-def update_keyboard_state(keyboard_state: dict, guess_word: str, target_word: str) -> dict:
-    """Updates the keyboard state based on the given guess and target word.
-
-    If a letter is present in the target word but not in the guess word, it is marked yellow.
-    If a letter is present in the target word and in the guess word, it is marked green.
-    If a letter is not present in the target word, it is marked black (dark grey).
-    
+def display_game_board(buf: list, rendered_rows: list, width: int = 80) -> None:
+    """Displays the game board with the given rows.
 
     Parameters
     ----------
-    keyboard_state : dict
-        The current state of the keyboard.
-    guess_word : str
-        Guess word.
-    target_word : str
-        Target word.
-
-    Returns
-    -------
-    dict
-        Updated keyboard state.
+    buf : list
+        Frame buffer the lines are appended to.
+    rendered_rows : list
+        The board rows rendered with `render_board_row`.
+    width : int, optional
+        Width of the game board, by default 80
     """
 
-    for letter in set(guess_word):
-        if letter not in keyboard_state:
-            keyboard_state[letter] = "\033[100m" + letter + "\033[0m"
-
-    for i, letter in enumerate(guess_word):
-        if letter == target_word[i]:
-            keyboard_state[letter] = "\033[42m" + letter + "\033[0m"
-
-    for i, letter in enumerate(guess_word):
-        if letter in target_word and keyboard_state.get(letter) != "\033[42m" + letter + "\033[0m":
-
-            if guess_word.count(letter) > sum(
-                    1 for j in range(len(target_word)) if guess_word[j] == letter and target_word[j] == letter):
-                keyboard_state[letter] = "\033[43m" + letter + "\033[0m"
+    if width == 80:
+        buf.append(_BOARD_TOP_80)
+        buf.extend(rendered_rows)
+        buf.append(_BOARD_BOT_80)
+        return
 
-    return keyboard_state
+    horizontal_border = "\033[100m─\033[0m" * (width - 5)
+    buf.append(("\033[100m┌\033[0m" + horizontal_border + "\033[100m┐\033[0m").center(width))
+    buf.extend(rendered_rows)
+    buf.append(("\033[100m└\033[0m" + horizontal_border + "\033[100m┘\033[0m").center(width))
 
 
-def display_keyboard(keyboard_state: dict, width: int = 80) -> None:
+def display_keyboard(buf: list, keyboard_state: list, width: int = 80) -> None:
     """Displays the keyboard with the given keyboard state.
 
     Parameters
     ----------
-    keyboard_state : dict
-        The current state of the keyboard.
+    buf : list
+        Frame buffer the lines are appended to.
+    keyboard_state : list
+        The state code of every key, indexed by letter from 'a' to 'z'.
     width : int, optional
         Width of the game board, by default 80
     """
 
-    horizontal_border = "─"
     vertical_border = "│"
-    corner_top_left = "┌"
-    corner_top_right = "┐"
-    corner_bottom_left = "└"
-    corner_bottom_right = "┘"
     reset_style = "\033[0m"
 
-    keyboard_rows = [' q w e r t y u i o p ', '  a s d f g h j k l  ', '   z x c v b n m   ']
-
-    inner_width = max(len(row) for row in keyboard_rows)
-
-    padding_left = (width - inner_width) // 2
-    padding_right = width - inner_width - padding_left
+    if width == 80:
+        pad_left, pad_right = _PAD_KEYBD_L, _PAD_KEYBD_R
+    else:
+        padding_left = (width - _KEYBOARD_WIDTH) // 2
+        pad_left, pad_right = ' ' * padding_left, ' ' * (width - _KEYBOARD_WIDTH - padding_left)
 
-    print(' ' * padding_left + corner_top_left + (horizontal_border * inner_width) + corner_top_right +
-          ' ' * padding_right)
+    buf.append(pad_left + _KEYBOARD_TOP + pad_right)
 
-    for i, row in enumerate(keyboard_rows):
+    # maps every letter to its coloured glyph, or to itself if it has not been guessed yet
+    key_table = {ord(key): _KEY_GLYPHS[keyboard_state[idx]][idx] for idx, key in enumerate(ALPHABET)}
 
-        padded_row = vertical_border
+    for i, row in enumerate(KEYBOARD_ROWS):
 
-        for key in row:
-            if key.isalpha():
-                colored_key = keyboard_state.get(key, key)
-                padded_row += colored_key
-            else:
-                padded_row += key
+        padded_row = vertical_border + row.translate(key_table)
 
         if i == 2:
             padded_row += '  '
         padded_row += vertical_border
 
-        print(' ' * padding_left + padded_row + ' ' * padding_right)
+        buf.append(pad_left + padded_row + pad_right)
+
+    buf.append(pad_left + _KEYBOARD_BOT + pad_right + reset_style)
+
+
+def pack_word(word: str) -> int:
+    """Packs a word into an integer holding 5 bits per letter, the first letter in the lowest bits.
+
+    Parameters
+    ----------
+    word : str
+        The word to pack.
+
+    Returns
+    -------
+    int
+        The packed word.
+    """
+    packed = 0
+    for i, letter in enumerate(word):
+        packed |= (ord(letter) - 97) << (5 * i)
+    return packed
+
+
+def pack_counts(word: str) -> int:
+    """Packs the letter counts of a word into an integer holding a 6 bit counter per letter of the alphabet.
+
+    Parameters
+    ----------
+    word : str
+        The word whose letters are counted.
+
+    Returns
+    -------
+    int
+        The packed letter counts.
+    """
+    counts = 0
+    for letter in word:
+        counts += 1 << (6 * (ord(letter) - 97))
+    return counts
+
 
-    print(' ' * padding_left + corner_bottom_left + (horizontal_border * inner_width) + corner_bottom_right +
-          ' ' * padding_right + reset_style)
+def score_packed(guess_packed: int, target_packed: int, target_counts: int) -> tuple[int, int]:
+    """Scores a packed 5-letter guess against a packed 5-letter target word.
 
+    Greens are the lanes where the guess and the target agree, i.e. where their XOR is zero, and are found for all lanes
+    at once without branching. Yellows are then handed out left to right while the packed counter of the letter still
+    has unmatched copies in the target.
 
-def wordle_guess(target_word: str, guess_word: str, keyboard_state: dict, current_progress: str) -> tuple[str, str]:
-    """Creates a guess result and updates the keyboard state and current progress.
-    
     Parameters
     ----------
-    target_word : str
-        The target word.
+    guess_packed : int
+        The guess word packed with `pack_word`.
+    target_packed : int
+        The target word packed with `pack_word`.
+    target_counts : int
+        Letter counts of the target word packed with `pack_counts`.
+
+    Returns
+    -------
+    tuple[int, int]
+        Bit masks of the green and yellow positions of the guess.
+    """
+    diff = guess_packed ^ target_packed
+
+    # fold each 5 bit lane onto its lowest bit, which is then set iff the letters differ, and flip it to mark greens
+    green_lanes = ((diff | diff >> 1 | diff >> 2 | diff >> 3 | diff >> 4) & _LANE_LSB) ^ _LANE_LSB
+    green_mask = (green_lanes | green_lanes >> 4 | green_lanes >> 8 | green_lanes >> 12 | green_lanes >> 16) & 0x1F
+
+    s0 = 6 * (guess_packed & 0x1F)
+    s1 = 6 * (guess_packed >> 5 & 0x1F)
+    s2 = 6 * (guess_packed >> 10 & 0x1F)
+    s3 = 6 * (guess_packed >> 15 & 0x1F)
+    s4 = 6 * (guess_packed >> 20 & 0x1F)
+
+    remaining = (target_counts - ((green_mask & 1) << s0) - ((green_mask >> 1 & 1) << s1) -
+                 ((green_mask >> 2 & 1) << s2) - ((green_mask >> 3 & 1) << s3) - ((green_mask >> 4 & 1) << s4))
+
+    # each yellow consumes a copy of its letter, so this pass has to stay sequential
+    yellow_mask = 0
+    if not green_mask & 1 and remaining >> s0 & 0x3F:
+        yellow_mask |= 1
+        remaining -= 1 << s0
+    if not green_mask & 2 and remaining >> s1 & 0x3F:
+        yellow_mask |= 2
+        remaining -= 1 << s1
+    if not green_mask & 4 and remaining >> s2 & 0x3F:
+        yellow_mask |= 4
+        remaining -= 1 << s2
+    if not green_mask & 8 and remaining >> s3 & 0x3F:
+        yellow_mask |= 8
+        remaining -= 1 << s3
+    if not green_mask & 16 and remaining >> s4 & 0x3F:
+        yellow_mask |= 16
+
+    return green_mask, yellow_mask
+
+
+def score_guess(target_packed: int, target_counts: int, guess_word: str, keyboard_state: list, progress_buf: bytearray,
+                revealed: bytearray) -> str:
+    """Scores the guess word against the target word, updating the keyboard state and current progress.
+
+    The guess is scored in two passes by `score_packed`. The first pass marks the letters in the correct position green,
+    the second pass marks the remaining letters yellow while the target word still has unmatched copies of them and dark
+    grey otherwise. The keyboard state keeps the best colour seen for each letter, with green over yellow over dark grey.
+
+    Parameters
+    ----------
+    target_packed : int
+        The target word packed with `pack_word`.
+    target_counts : int
+        Letter counts of the target word packed with `pack_counts`.
     guess_word : str
         The guess word.
-    keyboard_state : dict
-        The current state of the keyboard.
-    current_progress : str
-        The current progress of the game.
+    keyboard_state : list
+        The state code of every key, indexed by letter from 'a' to 'z'.
+    progress_buf : bytearray
+        The letters revealed so far, `*` where nothing has been revealed.
+    revealed : bytearray
+        Flags marking the positions revealed by green letters.
 
     Returns
     -------
-    tuple[str, str]
-        A tuple of the guess result and the current progress.
+    str
+        The guess result.
     """
-    result = ""
-    for i, letter in enumerate(guess_word):
+    green_mask, yellow_mask = score_packed(pack_word(guess_word), target_packed, target_counts)
+    result = [""] * len(guess_word)
 
-        if letter == target_word[i]:
-            result += f"\033[42m{letter}\033[0m"
-            current_progress[i] = f"\033[42m{letter}\033[0m"
-        elif letter in target_word:
-            result += f"\033[43m{letter}\033[0m"
+    for i, letter in enumerate(guess_word):
+        idx = ord(letter) - 97
+        if (green_mask >> i) & 1:
+            result[i] = GREEN[idx]
+            progress_buf[i] = idx + 97
+            revealed[i] = 1
+            keyboard_state[idx] = CORRECT
+        elif (yellow_mask >> i) & 1:
+            result[i] = YELLOW[idx]
+            if keyboard_state[idx] < PRESENT:
+                keyboard_state[idx] = PRESENT
         else:
-            result += f"\033[40m{letter}\033[0m"
-    update_keyboard_state(keyboard_state, guess_word, target_word)
+            result[i] = GREY[idx]
+            if keyboard_state[idx] == UNSEEN:
+                keyboard_state[idx] = ABSENT
+
+    return "".join(result)
+
+
+def render_progress(progress_buf: bytearray, revealed: bytearray) -> str:
+    """Renders the current progress with the revealed letters in green.
 
-    progress_display = "".join(current_progress)
-    return result, progress_display
+    Parameters
+    ----------
+    progress_buf : bytearray
+        The letters revealed so far, `*` where nothing has been revealed.
+    revealed : bytearray
+        Flags marking the positions revealed by green letters.
+
+    Returns
+    -------
+    str
+        The current progress.
+    """
+    return "".join(GREEN[progress_buf[i] - 97] if revealed[i] else "*" for i in range(len(progress_buf)))
 
 
-def clear_screen() -> None:
-    """Clears the screen.
+def enable_virtual_terminal() -> None:
+    """Enables ANSI escape sequence processing on the Windows console.
 
-    This function is taken from https://stackoverflow.com/a/684344
+    Windows 10 and later understand the escape sequences used for colours and screen clearing once
+    ENABLE_VIRTUAL_TERMINAL_PROCESSING is set on the output handle. Other platforms need nothing.
     """
-    if os.name == 'nt':
-        _ = os.system('cls')
-    else:
-        _ = os.system('clear')
+    if os.name != 'nt':
+        return
+
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except (AttributeError, OSError):
+        pass
+
+
+def write_frame(buf: list, clear: bool = False) -> None:
+    """Writes the buffered lines to the terminal in a single write and empties the buffer.
+
+    Parameters
+    ----------
+    buf : list
+        Frame buffer holding the lines to write.
+    clear : bool, optional
+        Clear the screen before the frame, by default False
+    """
+    frame = "\n".join(buf) + "\n"
+    if clear:
+        frame = CLEAR_SCREEN + frame
+
+    with contextlib.suppress(BrokenPipeError):
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+    buf.clear()
+
+
+def _score_rows(stats: dict, bars: list, max_count: int, length: int, style: str, padding: str) -> list:
+    """Renders the histogram rows with every bar cut to the given length.
 
+    Parameters
+    ----------
+    stats : dict
+        Stats dictionary
+    bars : list
+        Full bar length of every row
+    max_count : int
+        Highest count in the stats, marked with a trophy
+    length : int
+        Length the bars are cut to
+    style : str
+        Bar style
+    padding : str
+        Left padding of every row
+
+    Returns
+    -------
+    list
+        The histogram rows.
+    """
+    rows = []
+    for (attempt, count), bar_length in zip(stats.items(), bars):
+        done = length >= bar_length
+        score_display = f' {count}' if done and count != 0 else ''
+        trophy_display = ' 🏆' if done and count == max_count and count != 0 else ''
+        rows.append(f'{padding}{attempt} {style * min(length, bar_length)}{score_display}{trophy_display}')
+    return rows
 
-def display_score(stats: dict, max_bar_length=50, animation_speed=0.05, style='█', width=80) -> None:
-    """Print an animated histogram with a trophy symbol next to the highest score.
 
-    _extended_summary_
+def display_score(stats: dict, max_bar_length=50, animation_speed=0.05, style='█', width=80, animate=False) -> None:
+    """Print a histogram with a trophy symbol next to the highest score.
 
     Parameters
     ----------
@@ -253,59 +429,52 @@ def display_score(stats: dict, max_bar_length=50, animation_speed=0.05, style='
     max_bar_length : int, optional
         Maximum length of the bar, by default 50
     animation_speed : float, optional
-        Animation speed, by default 0.05
+        Delay between animation frames, by default 0.05
     style : str, optional
         Bar style, by default '█'
     width : int, optional
         Width of the histogram, by default 80
+    animate : bool, optional
+        Grow the bars one step at a time, by default False
     """
     if not stats:
         print("No data to display.")
         return
 
-    horizontal_border = "─"
     vertical_border = "│"
-    corner_top_left = "┌"
-    corner_top_right = "┐"
-    corner_bottom_left = "└"
-    corner_bottom_right = "┘"
     reset_style = "\033[0m"
 
-    title_text = f"Score".center(width - 5)
-
-    inner_width = width - 5
+    if width == 80:
+        top_bar, bottom_bar, title_line = _TOP_BAR_80, _BOT_BAR_80, _SCORE_TITLE_80
+    else:
+        horizontal_border = "─" * (width - 5)
+        top_bar, bottom_bar = "┌" + horizontal_border + "┐", "└" + horizontal_border + "┘"
+        title_line = vertical_border + "Score".center(width - 5) + vertical_border
 
-    print(corner_top_left + (horizontal_border * inner_width) + corner_top_right)
-    print(vertical_border + title_text + vertical_border)
-    print(corner_bottom_left + (horizontal_border * inner_width) + corner_bottom_right + reset_style)
+    frame = [top_bar, title_line, bottom_bar + reset_style]
 
     max_count = max(stats.values())
-
     scaling_factor = max_bar_length / max_count if max_count > max_bar_length else 1
+    bars = [min(max_bar_length, int(count * scaling_factor)) if count else 0 for count in stats.values()]
+    padding = ' ' * ((width - max_bar_length) // 2)
 
-    highest_attempts = [attempt for attempt, count in stats.items() if count == max_count]
-
-    paading_left = (width - max_bar_length) // 2
-
-    length = max_bar_length
-    for attempt, count in stats.items():
-        if count == 0:
-            bar_length = 0
-        else:
-            final_bar_length = int(count * scaling_factor)
-            bar_length = min(length, final_bar_length)
-
-        score_display = f' {count}' if length >= bar_length and count != 0 else ''
-        trophy_display = ' 🏆' if attempt in highest_attempts and length >= final_bar_length else ''
-        print(' ' * paading_left + f'{attempt} {style * bar_length}{score_display}{trophy_display}')
+    if not animate:
+        frame.extend(_score_rows(stats, bars, max_count, max_bar_length, style, padding))
+        sys.stdout.write("\n".join(frame) + "\n")
+        return
 
-    time.sleep(animation_speed)
-    if length < max_bar_length:
-        print(f"\033[{len(stats)}A", end='')
+    sys.stdout.write("\n".join(frame) + "\n")
+    longest_bar = max(bars)
+    for length in range(longest_bar + 1):
+        sys.stdout.write("\n".join(_score_rows(stats, bars, max_count, length, style, padding)) + "\n")
+        sys.stdout.flush()
+        time.sleep(animation_speed)
+        if length < longest_bar:
+            sys.stdout.write(f"\033[{len(stats)}A")
 
 
 def update_stats(filename: str, attempt: int) -> None:
-    """Update the stats file with the new attempt
+    """Update the stats file with the new attempt, creating it if it does not exist yet
 
     Parameters
     ----------
@@ -314,16 +483,22 @@ def update_stats(filename: str, attempt: int) -> None:
     attempt : int
         attempt number
     """
-    with open(filename, 'r') as f:
-        stats = json.load(f)
+    try:
+        with open(filename, 'rb') as f:
+            stats = json.load(f)
+    except FileNotFoundError:
+        stats = {str(i): 0 for i in range(1, 7)}
 
     if attempt < 7:
         stats[str(attempt)] += 1
 
-    display_score(stats, max_bar_length=30, animation_speed=0.05, style='.')
+    display_score(stats, max_bar_length=30, animation_speed=0.05, style='.', animate=False)
 
-    with open(filename, 'w') as f:
+    # write to a temporary file first so a crash never leaves a truncated stats file behind
+    tmp_filename = filename + '.tmp'
+    with open(tmp_filename, 'w') as f:
         json.dump(stats, f)
+    os.replace(tmp_filename, filename)
 
 
 def play_wordle() -> None:
@@ -331,33 +506,44 @@ def play_wordle() -> None:
 
     The game is played in the terminal. The player has 6 attempts to guess a 5-letter word.
     """
-    target_word = random.choice(WORDS)
+    target_word = random_word()
+    target_packed = pack_word(target_word)
+    target_counts = pack_counts(target_word)
+    tlen = len(target_word)
     attempts = 6
-    guesses = []
-    keyboard_state = {}
-    current_progress = ["*"] * len(target_word)
+    rendered_rows = []
+    keyboard_state = [UNSEEN] * 26
+    progress_buf = bytearray(b"*" * tlen)
+    revealed = bytearray(tlen)
 
-    clear_screen()
+    buf = []
+
+    enable_virtual_terminal()
     colored_title = "\033[100mW\033[0m\033[42mO\033[0m\033[43mR\033[0m\033[100mD\033[0m\033[42mL\033[0m\033[43mE\033[0m \033[100mG\033[0m\033[42mA\033[0m\033[43mM\033[0m\033[100mE\033[0m"
-    display_title_bar(colored_title, width=80)
-    print_centered("Welcome to Wordle! You have 6 attempts to guess a 5-letter word.", width=80)
+    display_title_bar(buf, colored_title, width=80)
+    buf.append("Welcome to Wordle! You have 6 attempts to guess a 5-letter word.".center(80))
+    write_frame(buf, clear=True)
+
+    # bound once so the guess loop does local lookups only
+    is_allowed = contains
+    prompt = "Enter your guess: "
+    invalid_message = f"Please enter a valid {tlen}-letter word from the word list."
 
     while attempts > 0:
-        guess_word = input("Enter your guess: ").lower().strip()
+        guess_word = input(prompt).lower().strip()
 
-        if len(guess_word) != len(target_word) or guess_word not in WORDS:
-            print(f"Please enter a valid {len(target_word)}-letter word from the word list.")
+        if len(guess_word) != tlen or not is_allowed(guess_word):
+            print(invalid_message)
             continue
 
-        guess_result, progress_display = wordle_guess(target_word, guess_word, keyboard_state, current_progress)
-        guesses.append(guess_result)
-        clear_screen()
-        display_title_bar(colored_title, width=80)
-        display_game_board(guesses, width=80)
-        print(f"\nProgress: {progress_display}")
-        print(f"Attempt: {7-attempts}")
-        keyboard_state = update_keyboard_state(keyboard_state, guess_word, target_word)
-        display_keyboard(keyboard_state, width=80)
+        guess_result = score_guess(target_packed, target_counts, guess_word, keyboard_state, progress_buf, revealed)
+        rendered_rows.append(render_board_row(guess_result, width=80))
+        display_title_bar(buf, colored_title, width=80)
+        display_game_board(buf, rendered_rows, width=80)
+        buf.append(f"\nProgress: {render_progress(progress_buf, revealed)}")
+        buf.append(f"Attempt: {7-attempts}")
+        display_keyboard(buf, keyboard_state, width=80)
+        write_frame(buf, clear=True)
 
         if guess_word == target_word:
             break
@@ -369,8 +555,4 @@ def play_wordle() -> None:
     else:
         print(f"\nSorry, you've run out of attempts. The word was '{target_word}'.\n")
 
-    if not os.path.exists('stats.json'):
-        with open('stats.json', 'w') as f:
-            json.dump({str(i): 0 for i in range(1, 7)}, f)
-
     update_stats('stats.json', 7 - attempts)